@@ -10,7 +10,9 @@ import hashlib
 import importlib
 
 class ModularUpdater:
-    def __init__(self, auto_check=False):
+    def __init__(self, auto_check=False, before_exit=None):
+        # Called before the app exits to restart or install an update, e.g. to finish saving
+        self.before_exit = before_exit
         self.version_file = str(Path.home()) + "/TODOapp/version.txt"
         self.manifest_file = str(Path.home()) + "/TODOapp/manifest.json"
         self.current_version = self.get_current_version()
@@ -400,6 +402,9 @@ class ModularUpdater:
         """Restart the application"""
         try:
             current_exe = sys.executable if not getattr(sys, 'frozen', False) else sys.argv[0]
+            # The new process reads todo.txt straight away, so the last save must be on disk
+            if self.before_exit:
+                self.before_exit()
             subprocess.Popen([current_exe] + sys.argv[1:])
             sys.exit()
         except Exception as e:
@@ -481,6 +486,8 @@ except Exception as e:
     print(f"Update failed: {{e}}")
 ''')
                 
+                if self.before_exit:
+                    self.before_exit()
                 subprocess.Popen([sys.executable, cleanup_script], 
                                  creationflags=subprocess.CREATE_NO_WINDOW)
                 
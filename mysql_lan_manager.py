@@ -323,11 +323,29 @@ class MySQLLANManager:
 
     def sync_tasks_to_mysql(self):
         """Sync local tasks to MySQL database - only tasks, not character data"""
+        data = self.collect_sync_data()
+        if data is not None:
+            self.upload_tasks(*data)
+
+    def collect_sync_data(self):
+        """Snapshot what sync_tasks_to_mysql uploads, or None if MySQL is off"""
+        # Reads Tk variables and widgets, so this must run on the UI thread; the result
+        # is plain data that upload_tasks can send from a worker thread
         if not self.mysql_enabled.get():
-            return
-        
+            return None
+        
+        tasks = self.parent_app.load_tasks()
+        daily_texts = []
+        if hasattr(self.parent_app, 'daily_todo_manager') and hasattr(self.parent_app.daily_todo_manager, 'tasks'):
+            for task in self.parent_app.daily_todo_manager.tasks:
+                if task.winfo_exists():
+                    daily_texts.append(task.cget("text"))
+        return dict(self.mysql_config), tasks, daily_texts
+
+    def upload_tasks(self, mysql_config, tasks, daily_texts):
+        """Replace the MySQL task tables with a collect_sync_data snapshot (no Tk access)"""
         try:
-            conn = mysql.connector.connect(**self.mysql_config)
+            conn = mysql.connector.connect(**mysql_config)
             cursor = conn.cursor()
             
             # Clear existing tasks
@@ -335,7 +353,6 @@ class MySQLLANManager:
             cursor.execute("DELETE FROM daily_tasks")
             
             # Insert regular tasks
-            tasks = self.parent_app.load_tasks()
             for task in tasks:
                 cursor.execute(
                     "INSERT INTO tasks (task_name, due_date, priority) VALUES (%s, %s, %s)",
@@ -343,13 +360,11 @@ class MySQLLANManager:
                 )
             
             # Insert daily tasks
-            if hasattr(self.parent_app, 'daily_todo_manager') and hasattr(self.parent_app.daily_todo_manager, 'tasks'):
-                for i, task in enumerate(self.parent_app.daily_todo_manager.tasks):
-                    if task.winfo_exists():
-                        cursor.execute(
-                            "INSERT INTO daily_tasks (task_text, position) VALUES (%s, %s)",
-                            (task.cget("text"), i)
-                        )
+            for i, text in enumerate(daily_texts):
+                cursor.execute(
+                    "INSERT INTO daily_tasks (task_text, position) VALUES (%s, %s)",
+                    (text, i)
+                )
             
             conn.commit()
             cursor.close()
@@ -4,8 +4,10 @@ This is the main application file that coordinates all the different modules and
 the core application framework including settings, options, and window management.
 """
 
+import atexit
 import json
 import os
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
@@ -63,7 +65,6 @@ except ImportError:
 if getattr(sys, "frozen", False):
     base_path = sys._MEIPASS
     # Register cleanup for MEI folder on exit
-    import atexit
     import shutil
     def cleanup_mei():
         try:
@@ -75,8 +76,9 @@ else:
     base_path = os.path.dirname(__file__)
 
 ICON_PATH = os.path.join(base_path, "clipboard.png")
-CHARACTER_FILE = str(Path.home()) + "/TODOapp/character.txt"
-VERSION_FILE = str(Path.home()) + "/TODOapp/version.txt"
+CHARACTER_FILE = Path.home() / "TODOapp" / "character.txt"
+VERSION_FILE = Path.home() / "TODOapp" / "version.txt"
+NON_DIGIT_RE = re.compile(r"\D")
 
 class SingletonMeta(type):
     """Metaclass for singleton pattern"""
@@ -524,8 +526,7 @@ The app will continue to work normally for task management without AI features."
 
     def parse_date(self, raw_date):
         """Parse date string to standardized format"""
-        import re
-        digits = re.sub(r"\D", "", raw_date)
+        digits = NON_DIGIT_RE.sub("", raw_date)
         if len(digits) not in [6, 8]:
             return None
         
@@ -535,7 +536,11 @@ The app will continue to work normally for task management without AI features."
         yyyy = f"20{yy}" if len(digits) ==6 else digits[4:8]
         
         try:
-            datetime.strptime(f"{mm}-{dd}-{yyyy}", "%m-%d-%Y")
+            if digits.isascii():
+                # Same range/leap-year check as strptime, without re-parsing the string
+                datetime(int(yyyy), int(mm), int(dd))
+            else:
+                datetime.strptime(f"{mm}-{dd}-{yyyy}", "%m-%d-%Y")
             return f"{mm}-{dd}-{yyyy}"
         except ValueError:
             return None
@@ -556,6 +561,12 @@ The app will continue to work normally for task management without AI features."
         if hasattr(self, 'todo_list_manager'):
             self.todo_list_manager.save_tasks(tasks, skip_mysql)
 
+    def flush_pending_saves(self):
+        """Wait for background saves (task file and MySQL) to finish"""
+        if hasattr(self, 'todo_list_manager'):
+            self.todo_list_manager.flush_pending_writes()
+            self.todo_list_manager.flush_pending_sync()
+
     def refresh_task_list(self):
         """Refresh the task list display"""
         if hasattr(self, 'todo_list_manager'):
@@ -734,13 +745,14 @@ The app will continue to work normally for task management without AI features."
 
     def check_tasks_status(self):
         """Check if tasks need to be refreshed"""
-        current_date = datetime.now().date()
+        current_datetime = datetime.now()
+        current_date = current_datetime.date()
         
         # Refresh if:
         # 1. The date has changed (midnight crossed)
-        # 2. Or if there are tasks in the list (to update overdue status)
+        # 2. Or a task due today has passed its due time (to update overdue status)
         if (current_date != self.last_refresh_date or 
-            (hasattr(self, 'todo_list_manager') and len(self.todo_list_manager.tree.get_children()) > 0)):
+            (hasattr(self, 'todo_list_manager') and self.todo_list_manager.has_overdue_change(current_datetime))):
             
             # Check for daily task reset if date changed
             if current_date != self.last_refresh_date and hasattr(self, 'daily_todo_manager'):
@@ -1185,7 +1197,7 @@ The app will continue to work normally for task management without AI features."
         try:
             if MODULAR_UPDATER_AVAILABLE:
                 # Create a fresh updater instance for manual check
-                updater = ModularUpdater(auto_check=False)
+                updater = ModularUpdater(auto_check=False, before_exit=self.flush_pending_saves)
                 # Manually trigger the update check
                 updater.check_for_updates()
             else:
@@ -1300,8 +1312,10 @@ The app will continue to work normally for task management without AI features."
         # Now make it modal after positioning
         dialog.grab_set()
         
-        # Store original destroy method
-        original_destroy = dialog.destroy
+        # Store original destroy method (only the first time - reusable dialogs are
+        # registered again every time they are shown)
+        original_destroy = getattr(dialog, "_original_destroy", None) or dialog.destroy
+        dialog._original_destroy = original_destroy
         
         def cleanup_and_destroy():
             if self.current_dialog == dialog:
@@ -1318,6 +1332,16 @@ The app will continue to work normally for task management without AI features."
         # Also handle window close event
         dialog.protocol("WM_DELETE_WINDOW", cleanup_and_destroy)
 
+    def release_dialog(self, dialog):
+        """Hide a reusable dialog instead of destroying it, releasing it like destroy would"""
+        if self.current_dialog == dialog:
+            self.current_dialog = None
+        try:
+            dialog.grab_release()  # Release modal grab
+        except:
+            pass
+        dialog.withdraw()
+
 class LoadingScreen:
     """Loading screen to show startup progress"""
     def __init__(self):
@@ -1394,6 +1418,9 @@ if __name__ == "__main__":
         
         loading.update_status("Loading application...", "Setting up interface")
         app = TodoApp(root)
+        # Tasks are saved in the background; finish the last save however the app exits,
+        # including sys.exit() from the updater
+        atexit.register(app.flush_pending_saves)
         
         loading.update_status("Loading application...", "Loading tasks")
         
@@ -1405,7 +1432,7 @@ if __name__ == "__main__":
         def background_update_check():
             try:
                 if MODULAR_UPDATER_AVAILABLE:
-                    ModularUpdater(auto_check=True)
+                    ModularUpdater(auto_check=True, before_exit=app.flush_pending_saves)
             except Exception as e:
                 print(f"Background update check failed: {e}")
         
@@ -4,13 +4,275 @@ Contains all functionality for the main To Do Task List Panel including task cre
 editing, completion tracking, and task management with notes support.
 """
 
-import os
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkcalendar import DateEntry
-from datetime import datetime, timedelta
+import tkinter.font as tkfont
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+import bisect
+import queue
 import re
+import threading
+
+
+# Placeholder stored for tasks without notes (compared with ==, the file round-trip
+# produces fresh strings)
+NO_NOTES = "No notes"
+
+# Rows inserted per pass when filling the task list (longer lists continue from after())
+_ROW_CHUNK = 200
+
+_NON_DIGIT_RE = re.compile(r"\D")
+# Bulk-add lines that can only parse to "task name, due today, no time, priority 5":
+# no digits, no field delimiter, and none of the words the date/time/priority/"due"
+# heuristics react to. Anything else goes through the full parser.
+_BULK_DELIMITERS = (' - ', ' | ', ' :: ', ' // ')
+_BULK_DELIMITER_RE = re.compile(r' (?:- |\| |:: |// )')  # Any of _BULK_DELIMITERS, in one scan
+_BULK_KEYWORDS = frozenset((
+    'today', 'now', 'tomorrow', 'tmr', 'tmrw', 'tom', 'yesterday', 'eow', 'weekend',
+    'eom', 'eoy', 'next', 'this', 'end', 'due', 'on', 'at', 'by', 'for',
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+    'mon', 'tue', 'tues', 'wed', 'thu', 'thur', 'thurs', 'fri', 'sat', 'sun',
+))
+# Substrings that make a task-name word worth checking for a priority (matched on lowercase)
+_PRIORITY_HINT_RE = re.compile(r'priority|urgent|high|low|medium')
+_DIGIT_RE = re.compile(r"\d")
+_LETTERS_RE = re.compile(r"[^\W\d_]+")
+
+# Displayed task time: "14:30", "2:30 PM", "12:05am"
+_TIME_RE = re.compile(r"\s*(\d{1,2}):(\d{2})\s*(AM|PM)?\s*$", re.IGNORECASE)
+
+# Bulk-add parsing patterns, compiled once (tried in order; the date and time
+# extractors rely on each pattern's position in its list)
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # MM/DD/YYYY or MM-DD-YYYY
+    r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{2})',  # MM/DD/YY or MM-DD-YY
+    r'(\d{1,2})\.(\d{1,2})\.(\d{4})',      # MM.DD.YYYY
+    r'(\d{1,2})\.(\d{1,2})\.(\d{2})',      # MM.DD.YY
+))
+_PRIORITY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'priority\s*(\d)',
+    r'pri\s*(\d)',
+    r'p\s*(\d)',
+))
+_TIME_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)',  # 12:30 PM, 2:15 am
+    r'(\d{1,2}):(\d{2})',                  # 14:30, 09:15 (24-hour)
+    r'(\d{1,2})\s*(am|pm|AM|PM)',          # 2 PM, 9 am
+    r'(\d{1,2})(\d{2})\s*(am|pm|AM|PM)',   # 230 PM, 915 am
+    r'(\d{1,2})(\d{2})',                   # 1430, 0915 (24-hour without colon)
+))
+_AMPM_RE = re.compile(r'am|pm|AM|PM')  # Suffix the 12-hour _TIME_PATTERNS (0, 2 and 3) need
+# "due at", "on", "by" ... when followed by a date/time (removed from task names)
+_DUE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bdue\s+at\b',
+    r'\bdue\s+on\b',
+    r'\bdue\s+by\b',
+    r'\bdue\s+for\b',
+    r'\bdue\b(?=\s+\d)',  # "due" followed by date/time
+    r'\bdue\b(?=\s+(?:today|tomorrow|tmr|monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
+    r'\bdue\b(?=\s+(?:next|this|end\s+of))',
+    r'\bdue\b(?=\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))',
+    # Standalone prepositions before date/time (but keep them if part of task name)
+    r'\b(?:on|at|by|for)\b(?=\s+(?:today|tomorrow|tmr|tmrw))',
+    r'\b(?:on|at|by|for)\b(?=\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
+    r'\b(?:on|at|by|for)\b(?=\s+(?:mon|tue|wed|thu|fri|sat|sun)\b)',
+    r'\b(?:on|at|by|for)\b(?=\s+(?:next|this)\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday|week|month))',
+    r'\b(?:on|at|by|for)\b(?=\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))',
+    r'\b(?:on|at|by|for)\b(?=\s+\d{1,2}[/\-])',  # Before date patterns like 02/15
+    r'\b(?:on|at|by|for)\b(?=\s+the\s+\d{1,2}(?:st|nd|rd|th))',  # "on the 15th"
+    r'\b(?:on|at|by)\b(?=\s+\d{1,2}(?:st|nd|rd|th))',  # "on 15th"
+))
+# Relative and named date phrases read by extract_date_from_text (matched at the start)
+_IN_PERIOD_RE = re.compile(r'in\s+(\d+)\s*(day|days|week|weeks|month|months)')
+_MONTH_DAY_RE = re.compile(r'([a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*,?\s*(\d{4}))?')
+_DAY_MONTH_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([a-z]+)(?:\s*,?\s*(\d{4}))?')
+_ORDINAL_DAY_RE = re.compile(r'(?:the\s+)?(\d{1,2})(?:st|nd|rd|th)')
+# Month and weekday names understood in bulk-add dates
+_MONTH_NAMES = {
+    'january': 1, 'jan': 1, 'february': 2, 'feb': 2, 'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4, 'may': 5, 'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7, 'august': 8, 'aug': 8, 'september': 9, 'sep': 9, 'sept': 9,
+    'october': 10, 'oct': 10, 'november': 11, 'nov': 11, 'december': 12, 'dec': 12
+}
+# Weekday name -> date.weekday() number
+_WEEKDAY_IDX = {name: i for i, name in enumerate(
+    ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'))}
+_WEEKDAY_ABBREVS = {'mon': 'monday', 'tue': 'tuesday', 'tues': 'tuesday', 'wed': 'wednesday',
+                    'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday',
+                    'fri': 'friday', 'sat': 'saturday', 'sun': 'sunday'}
+# Words extract_date_from_text can read as a date on their own without containing a
+# digit, and first words of the digit-free two-word dates ("next fri", "month end")
+_DATE_WORDS = frozenset(
+    ('today', 'now', 'tomorrow', 'tmr', 'tmrw', 'tom', 'yesterday', 'eow', 'weekend', 'eom', 'eoy')
+    + tuple(_WEEKDAY_IDX) + tuple(_WEEKDAY_ABBREVS))
+_DATE_PHRASE_STARTS = frozenset(('next', 'this', 'month', 'year'))
+# Every _DUE_PATTERNS entry starts with one of these words; text without them is left alone
+_DUE_WORD_RE = re.compile(r'\b(?:due|on|at|by|for)\b', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _parse_mdy(date_str):
+    """Parse a stored mm-dd-yyyy date string into a date (memoized - many tasks share a date)"""
+    # Zero-padded MM-DD-YYYY (what the app writes) is sliced directly; anything else,
+    # e.g. unpadded "1-5-2026", goes through strptime so the accepted inputs are unchanged
+    if len(date_str) == 10 and date_str[2] == date_str[5] == "-" and date_str.isascii():
+        month, day, year = date_str[:2], date_str[3:5], date_str[6:]
+        if month.isdigit() and day.isdigit() and year.isdigit():
+            return date(int(year), int(month), int(day))
+    return datetime.strptime(date_str, "%m-%d-%Y").date()
+
+
+@lru_cache(maxsize=1024)
+def _time_key(time_str):
+    """Sort key for a stored HH:MM time: (0, hour, minute), or (1, 23, 59) when there is no valid time (memoized)"""
+    # Tasks without a time sort last within their day
+    if time_str and time_str.strip():
+        try:
+            hour, minute = map(int, time_str.split(':'))
+            return (0, hour, minute)  # 0 prefix means has time, sorts first
+        except ValueError:  # Not two integers separated by a colon
+            pass
+    return (1, 23, 59)
+
+
+@lru_cache(maxsize=2048)
+def _name_key(name):
+    """Normalized task name used for duplicate detection (memoized - computed once per name)"""
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=256)
+def _parse_display_time(time_str):
+    """Parse a displayed time ("14:30", "2:30 PM", "--:--") into (hour, minute) or None (memoized)"""
+    if not time_str or time_str == "--:--":
+        return None
+    # Well-formed times are matched in one pass; anything else takes the general path below
+    match = _TIME_RE.match(time_str)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+        ampm = match.group(3)
+        if ampm:
+            is_pm = ampm[0] in "Pp"  # The regex only captures AM/PM in either case
+            if is_pm and hour != 12:
+                hour += 12
+            elif not is_pm and hour == 12:
+                hour = 0
+        return (hour, minute)
+    try:
+        # Handle 12-hour format with AM/PM
+        if 'AM' in time_str.upper() or 'PM' in time_str.upper():
+            time_str_clean = time_str.upper().replace(' ', '')
+            if 'AM' in time_str_clean:
+                time_part = time_str_clean.replace('AM', '')
+                is_pm = False
+            else:
+                time_part = time_str_clean.replace('PM', '')
+                is_pm = True
+            hour, minute = map(int, time_part.split(':'))
+            if is_pm and hour != 12:
+                hour += 12
+            elif not is_pm and hour == 12:
+                hour = 0
+            return (hour, minute)
+        else:
+            # 24-hour format
+            hour, minute = map(int, time_str.split(':'))
+            return (hour, minute)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _format_time_24(time_str):
+    """Stored HH:MM time as shown in the task list in 24-hour mode ("--:--" for none)"""
+    if not time_str or not time_str.strip():
+        return "--:--"
+    try:
+        hour, minute = map(int, time_str.split(':'))
+        return f"{hour:02d}:{minute:02d}"
+    except ValueError:
+        return "--:--"
+
+
+@lru_cache(maxsize=256)
+def _format_time_12(time_str):
+    """Stored HH:MM time as shown in the task list in 12-hour mode ("--:--" for none)"""
+    if not time_str or not time_str.strip():
+        return "--:--"
+    try:
+        hour, minute = map(int, time_str.split(':'))
+        if hour == 0:
+            return f"12:{minute:02d} AM"
+        elif hour < 12:
+            return f"{hour}:{minute:02d} AM"
+        elif hour == 12:
+            return f"12:{minute:02d} PM"
+        else:
+            return f"{hour-12}:{minute:02d} PM"
+    except ValueError:
+        return "--:--"
+
+
+class Task(NamedTuple):
+    """A single task row: (task, date, time, priority, notes)"""
+    name: str
+    date: str  # mm-dd-yyyy
+    time: str  # HH:MM (24-hour) or "" for no specific time
+    priority: int
+    notes: str
+
+    @property
+    def due_date(self):
+        """Due date as a datetime.date"""
+        return _parse_mdy(self.date)
+
+    @property
+    def time_key(self):
+        """Due time as a sort key, see _time_key"""
+        return _time_key(self.time)
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a Task from a raw row (old 3/4-field tuples, JSON lists, MySQL rows)"""
+        if isinstance(row, cls):
+            return row
+        size = len(row)
+        if size == 5:
+            # Current format, e.g. from JSON or MySQL
+            name, date, due_time, priority, notes = row
+        elif size == 3:
+            # Old format: (task, date, priority) -> add empty time and "No notes"
+            name, date, due_time, priority, notes = row[0], row[1], "", row[2], NO_NOTES
+        elif size == 4:
+            # Could be old format (task, date, priority, notes) or partial new format
+            # Check if third element looks like a time
+            third = row[2]
+            if third == "" or ':' in (third if isinstance(third, str) else str(third)):
+                # New format missing notes
+                name, date, due_time, priority, notes = row[0], row[1], row[2], row[3], NO_NOTES
+            else:
+                # Old format (task, date, priority, notes) -> insert empty time
+                name, date, due_time, priority, notes = row[0], row[1], "", row[2], row[3]
+        else:
+            # If somehow we have more than 5 elements, keep only first 5
+            name, date, due_time, priority, notes = row[:5]
+        
+        # Handle empty notes - always ensure we have "No notes" if empty
+        if not notes or notes.strip() == "":
+            notes = NO_NOTES
+        return cls(name, date, due_time or "", int(priority), notes)
+
+
+@lru_cache(maxsize=4096)
+def _sort_key(task):
+    """Sort key for a Task: (date, time, inverse priority) (memoized - tasks are immutable)"""
+    # Date and time are parsed once per distinct string and cached as well
+    return (task.due_date, task.time_key, -task.priority)
 
 
 class ToDoListManager:
@@ -19,16 +281,63 @@ class ToDoListManager:
         self.todo_frame = todo_frame
         
         # TODO file path - Use home directory
-        self.TODO_FILE = str(Path.home()) + "/TODOapp/todo.txt"
+        self.TODO_FILE = Path.home() / "TODOapp" / "todo.txt"
         
         # Task data storage for notes and extended information
         self.task_data = {}
+        self._task_index = {}  # Treeview item -> position in the task list
+        self._insert_job = None  # Pending after() job inserting the rest of a long list
+        self._insert_rest = None  # (rows, start) that job will insert
+        self._refresh_job = None  # Pending after_idle() refresh from schedule_refresh
+        self._next_overdue = None  # Earliest due time among the rows shown as due today
+        # The calendar only changes with the tasks or the day, so refresh_task_list
+        # refreshes it only after a save or once the date has moved on
+        self._calendar_dirty = True
+        self._calendar_day = None
+        # Parsed bulk-add lines by (line, day); the preview re-parses every line on each change
+        self._parse_bulk_cached = lru_cache(maxsize=1024)(self._parse_bulk_task_line)
+        self._row_serial = 0  # Last Treeview item id handed out by _insert_rows
+        
+        # Add-task dialog kept (hidden) between uses: (dialog, reset_form, use_24_hour)
+        self._add_dialog = None
+        
+        # Background writer for todo.txt (see _queue_write)
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+        
+        # Deferred MySQL sync state (see _schedule_mysql_sync)
+        self._sync_job = None  # Pending after() job starting the upload
+        self._sync_data = None  # Snapshot still to be uploaded
+        self._sync_lock = threading.Lock()
+        self._sync_thread = None
+        
+        # In-memory task list - the file is only read once and written on every save
+        self._tasks = self._read_tasks_file()
         
         # Create todo list widgets
         self.create_todo_widgets()
+        
+        # Load tkcalendar in the background once the window is up, so opening the
+        # first add/edit dialog doesn't have to wait for the import
+        self.parent_app.root.after_idle(self._prewarm_tkcalendar)
+
+    def _prewarm_tkcalendar(self):
+        """Import tkcalendar off the UI thread (the dialogs import it again from the module cache)"""
+        def load():
+            try:
+                import tkcalendar
+            except ImportError:
+                pass  # Reported when a dialog actually needs it
+        threading.Thread(target=load, daemon=True).start()
 
     def create_todo_widgets(self):
         """Create the To Do List interface"""
+        # Named fonts for the task dialogs, created once and shared by every dialog opened
+        root = self.parent_app.root
+        self._title_font = tkfont.Font(root=root, family='Helvetica', size=12, weight='bold')
+        self._label_font = tkfont.Font(root=root, family='Helvetica', size=10, weight='bold')
+        self._italic_font = tkfont.Font(root=root, family='Helvetica', size=10, slant='italic')
+        
         # Task list inside its frame with action columns
         self.tree = ttk.Treeview(self.todo_frame, columns=("Task", "Due Date", "Due Time", "Priority", "Finish", "Edit", "Delete"), show="headings")
         
@@ -42,7 +351,14 @@ class ToDoListManager:
             self.tree.heading(col, text=symbol)
             self.tree.column(col, width=60, minwidth=50, stretch=False, anchor='center')
         
-        # Bind click events for action buttons
+        # Bind click events for action buttons, dispatched on Treeview column id
+        # (#1 = Task, #5..#7 = Finish/Edit/Delete) so a click needs no heading lookup
+        self._column_actions = {
+            "#1": self.show_task_notes,
+            "#5": lambda item: self.remove_task(),
+            "#6": lambda item: self.edit_task(),
+            "#7": lambda item: self.delete_task(),
+        }
         self.tree.bind("<Button-1>", self.on_tree_click)
         
         self.tree.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
@@ -63,20 +379,12 @@ class ToDoListManager:
         column = self.tree.identify('column', event.x, event.y)
         
         if item and column:
-            # Convert column ID to column name
-            col_name = self.tree.heading(column)['text']
-            
             # Select the item first
             self.tree.selection_set(item)
             
-            if col_name == "Finish":  # Finish button
-                self.remove_task()
-            elif col_name == "Edit":  # Edit button
-                self.edit_task()
-            elif col_name == "Delete":  # Delete button
-                self.delete_task()
-            elif col_name == "Task":  # Task name clicked - show notes
-                self.show_task_notes(item)
+            action = self._column_actions.get(column)
+            if action:
+                action(item)
 
     def show_task_notes(self, item):
         """Show notes/details for the selected task"""
@@ -105,22 +413,20 @@ class ToDoListManager:
             self.parent_app.register_dialog(notes_dialog)
             
             # Task name label
-            ttk.Label(notes_dialog, text=f"Task: {task_name}", font=('Helvetica', 12, 'bold')).pack(pady=10)
+            ttk.Label(notes_dialog, text=f"Task: {task_name}", font=self._title_font).pack(pady=10)
             
             # Notes display
-            ttk.Label(notes_dialog, text="Notes/Details:", font=('Helvetica', 10, 'bold')).pack(anchor='w', padx=10)
+            ttk.Label(notes_dialog, text="Notes/Details:", font=self._label_font).pack(anchor='w', padx=10)
             
-            notes_text = tk.Text(notes_dialog, wrap=tk.WORD, state='disabled', height=12)
+            notes_text = tk.Text(notes_dialog, wrap=tk.WORD, height=12)
             notes_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
             
-            # Insert notes or default message
-            notes_text.config(state='normal')
-            if notes.strip() and notes != "No notes":
+            # Insert notes or default message, then make the widget read-only
+            if notes.strip() and notes != NO_NOTES:
                 notes_text.insert("1.0", notes)
             else:
-                notes_text.insert("1.0", "No notes/extra info/details available for this task.")
-                notes_text.tag_add("italic", "1.0", "end")
-                notes_text.tag_config("italic", font=('Helvetica', 10, 'italic'), foreground="gray")
+                notes_text.tag_config("italic", font=self._italic_font, foreground="gray")
+                notes_text.insert("1.0", "No notes/extra info/details available for this task.", "italic")
             notes_text.config(state='disabled')
             
             # Button frame
@@ -145,46 +451,43 @@ class ToDoListManager:
 
     def sort_column(self, column, reverse):
         """Sort the tree view by column"""
+        if self._insert_job is not None:
+            # Put in the rows still queued by refresh_task_list first, or they would be
+            # appended after the sorted ones in their old order
+            self.parent_app.root.after_cancel(self._insert_job)
+            rows, start = self._insert_rest
+            self._insert_rows(rows, start, len(rows))
+        
         # Get current tasks
-        tasks = [(self.tree.set(child, column), child) for child in self.tree.get_children('')]
+        children = self.tree.get_children('')
+        if column == "Priority":
+            # Priorities are already ints in task_data - no Tk lookup or int() per row
+            tasks = [(self.task_data[child].priority, child) for child in children]
+        elif column in ("Due Date", "Due Time"):
+            # Sort on the stored task (date string, 24-hour "HH:MM") rather than reading
+            # the displayed cells back from Tk and parsing the 12/24-hour text again
+            tasks = [(self.task_data[child], child) for child in children]
+        else:
+            tasks = [(self.tree.set(child, column), child) for child in children]
         
         # Custom sorting
         if column == "Due Date":
             # Sort by date, then by time
             def date_time_key(x):
-                child = x[1]
-                date_str = self.tree.set(child, "Due Date")
-                time_str = self.tree.set(child, "Due Time")
-                date_val = datetime.strptime(date_str, "%m-%d-%Y")
+                task = x[0]
                 # Parse time, use 23:59 for empty time so tasks without time sort last
-                if time_str and time_str != "--:--":
-                    try:
-                        time_parts = self.parse_display_time_to_24h(time_str)
-                        if time_parts:
-                            date_val = date_val.replace(hour=time_parts[0], minute=time_parts[1])
-                        else:
-                            date_val = date_val.replace(hour=23, minute=59)
-                    except:
-                        date_val = date_val.replace(hour=23, minute=59)
-                else:
-                    date_val = date_val.replace(hour=23, minute=59)
-                return date_val
+                time_parts = _parse_display_time(task.time)
+                return (task.due_date, time_parts or (23, 59))
             tasks.sort(key=date_time_key, reverse=reverse)
         elif column == "Due Time":
             def time_key(x):
-                time_str = x[0]
-                if not time_str or time_str == "--:--":
-                    return (1, 23, 59)  # Empty times sort last
-                try:
-                    time_parts = self.parse_display_time_to_24h(time_str)
-                    if time_parts:
-                        return (0, time_parts[0], time_parts[1])
-                except:
-                    pass
-                return (1, 23, 59)
+                time_parts = _parse_display_time(x[0].time)
+                if time_parts:
+                    return (0, time_parts[0], time_parts[1])
+                return (1, 23, 59)  # Empty or unreadable times sort last
             tasks.sort(key=time_key, reverse=reverse)
         elif column == "Priority":
-            tasks.sort(key=lambda x: int(x[0]), reverse=reverse)
+            tasks.sort(key=lambda x: x[0], reverse=reverse)
         else:
             tasks.sort(reverse=reverse)
 
@@ -197,34 +500,11 @@ class ToDoListManager:
     
     def parse_display_time_to_24h(self, time_str):
         """Parse displayed time string back to 24-hour format (hour, minute) tuple"""
-        if not time_str or time_str == "--:--":
-            return None
-        try:
-            # Handle 12-hour format with AM/PM
-            if 'AM' in time_str.upper() or 'PM' in time_str.upper():
-                time_str_clean = time_str.upper().replace(' ', '')
-                if 'AM' in time_str_clean:
-                    time_part = time_str_clean.replace('AM', '')
-                    is_pm = False
-                else:
-                    time_part = time_str_clean.replace('PM', '')
-                    is_pm = True
-                hour, minute = map(int, time_part.split(':'))
-                if is_pm and hour != 12:
-                    hour += 12
-                elif not is_pm and hour == 12:
-                    hour = 0
-                return (hour, minute)
-            else:
-                # 24-hour format
-                hour, minute = map(int, time_str.split(':'))
-                return (hour, minute)
-        except:
-            return None
+        return _parse_display_time(time_str)
 
     def parse_date(self, raw_date):
         """Parse date string to mm-dd-yyyy format"""
-        digits = re.sub(r"\D", "", raw_date)
+        digits = _NON_DIGIT_RE.sub("", raw_date)
         if len(digits) not in [6, 8]:
             return None
         
@@ -234,7 +514,11 @@ class ToDoListManager:
         yyyy = f"20{yy}" if len(digits) ==6 else digits[4:8]
         
         try:
-            datetime.strptime(f"{mm}-{dd}-{yyyy}", "%m-%d-%Y")
+            if digits.isascii():
+                # Same range/leap-year check as strptime, without re-parsing the string
+                date(int(yyyy), int(mm), int(dd))
+            else:
+                datetime.strptime(f"{mm}-{dd}-{yyyy}", "%m-%d-%Y")
             return f"{mm}-{dd}-{yyyy}"
         except ValueError:
             return None
@@ -244,19 +528,35 @@ class ToDoListManager:
         # Check if any dialog is already open
         if self.parent_app.check_existing_dialog():
             return
+        
+        # Check user's time format preference
+        use_24_hour = True
+        if hasattr(self.parent_app, 'use_24_hour'):
+            use_24_hour = self.parent_app.use_24_hour.get()
+        
+        # Reuse the dialog hidden after the last add - building the DateEntry is most of
+        # the cost of opening it. Rebuild if the time format preference has changed.
+        if self._add_dialog is not None:
+            dialog, reset_form, built_24_hour = self._add_dialog
+            if dialog.winfo_exists() and built_24_hour == use_24_hour:
+                reset_form()
+                self._show_add_dialog(dialog)
+                return
+            if dialog.winfo_exists():
+                dialog.destroy()
+            self._add_dialog = None
             
         dialog = tk.Toplevel(self.parent_app.root)
         dialog.title("Add New Task")
         dialog.geometry("450x350")
         
-        # Register this dialog globally
-        self.parent_app.register_dialog(dialog)
-        
         ttk.Label(dialog, text="Task:").grid(row=0, column=0, padx=5, pady=5, sticky="nw")
         task_entry = ttk.Entry(dialog, width=40)
         task_entry.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(dialog, text="Due Date:").grid(row=1, column=0, padx=5, pady=5, sticky="nw")
+        # Imported lazily - tkcalendar pulls in babel, which is slow to load at startup
+        from tkcalendar import DateEntry
         date_entry = DateEntry(dialog,
                              date_pattern="mm-dd-yyyy",
                              background="darkblue",
@@ -268,11 +568,6 @@ class ToDoListManager:
         time_frame = ttk.Frame(dialog)
         time_frame.grid(row=2, column=1, padx=5, pady=5, sticky="w")
         
-        # Check user's time format preference
-        use_24_hour = True
-        if hasattr(self.parent_app, 'use_24_hour'):
-            use_24_hour = self.parent_app.use_24_hour.get()
-        
         hour_var = tk.StringVar(master=dialog, value="")
         minute_var = tk.StringVar(master=dialog, value="")
         ampm_var = tk.StringVar(master=dialog, value="AM")
@@ -301,6 +596,16 @@ class ToDoListManager:
         notes_text = tk.Text(dialog, width=40, height=6, wrap=tk.WORD)
         notes_text.grid(row=4, column=1, padx=5, pady=5)
         
+        def reset_form():
+            """Put the fields back to how a freshly built dialog shows them"""
+            task_entry.delete(0, tk.END)
+            date_entry.set_date(datetime.now().date())
+            hour_var.set("")
+            minute_var.set("")
+            ampm_var.set("AM")
+            priority_entry.set("")
+            notes_text.delete("1.0", tk.END)
+        
         def validate_and_add():
             date = self.parse_date(date_entry.get())
             if not date:
@@ -347,16 +652,35 @@ class ToDoListManager:
             
             notes = notes_text.get("1.0", tk.END).strip()
             self.add_task(task_entry.get(), date, due_time, priority, notes)
-            dialog.destroy()
+            self.parent_app.release_dialog(dialog)  # Hide it for the next add
 
         ttk.Button(dialog, text="Add", command=validate_and_add).grid(row=5, columnspan=2, pady=10)
+        
+        self._add_dialog = (dialog, reset_form, use_24_hour)
+        self._show_add_dialog(dialog)
+
+    def _show_add_dialog(self, dialog):
+        """Show the (possibly reused) add-task dialog as the current modal dialog"""
+        dialog.deiconify()
+        # Register this dialog globally
+        self.parent_app.register_dialog(dialog)
+        # Closing the window only hides it so the next add can reuse it
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.parent_app.release_dialog(dialog))
 
     def add_task(self, task, date, due_time, priority, notes="", check_duplicate=True):
         """Add a new task to the list"""
-        tasks = self.load_tasks()
+        if not self._insert_task(task, date, due_time, priority, notes, check_duplicate):
+            return False
+        self.save_tasks(self._tasks)
+        self.schedule_refresh()
+        return True
+    
+    def _insert_task(self, task, date, due_time, priority, notes="", check_duplicate=True):
+        """Insert a new task into the in-memory list without saving. Returns False if skipped."""
+        tasks = self._tasks
         # Ensure notes has a proper default value
         if not notes or notes.strip() == "":
-            notes = "No notes"
+            notes = NO_NOTES
         # Ensure due_time has a proper default value
         if not due_time or due_time.strip() == "":
             due_time = ""
@@ -375,20 +699,28 @@ class ToDoListManager:
                     return False
                 # If result == "create_new", just continue to add the task
         
-        tasks.append((task, date, due_time, priority, notes))
-        tasks = sorted(tasks, key=lambda x: self._task_sort_key(x))
-        self.save_tasks(tasks)
-        self.refresh_task_list()
+        # Binary-search the slot instead of appending and re-sorting the whole list
+        bisect.insort(tasks, Task(task, date, due_time, int(priority), notes), key=self._task_sort_key)
         return True
     
-    def find_duplicate_task(self, tasks, task_name):
+    def find_duplicate_task(self, tasks, task_name, name_index=None):
         """Find if a task with the same name already exists. Returns index or None."""
-        task_name_lower = task_name.lower().strip()
+        task_name_lower = _name_key(task_name)
+        if name_index is not None:
+            # Pre-built index from _build_name_index - a single lookup instead of a scan
+            return name_index.get(task_name_lower)
         for i, existing_task in enumerate(tasks):
-            if existing_task[0].lower().strip() == task_name_lower:
+            if _name_key(existing_task[0]) == task_name_lower:
                 return i
         return None
     
+    def _build_name_index(self, tasks):
+        """Map each normalized task name to the index of its first occurrence"""
+        name_index = {}
+        for i, existing_task in enumerate(tasks):
+            name_index.setdefault(_name_key(existing_task[0]), i)
+        return name_index
+    
     def show_duplicate_dialog(self, new_task_name, existing_task):
         """Show dialog when a duplicate task is found. Returns 'overwrite', 'create_new', or 'skip'."""
         existing_name, existing_date, existing_time, existing_priority, existing_notes = existing_task
@@ -500,25 +832,9 @@ class ToDoListManager:
         
         return result["value"]
     
-    def _task_sort_key(self, task):
-        """Generate sort key for a task (date, time, inverse priority)"""
-        date_str = task[1]
-        time_str = task[2] if len(task) > 2 else ""
-        priority = task[3] if len(task) > 3 else task[2]  # Handle old format
-        
-        date_val = datetime.strptime(date_str, "%m-%d-%Y")
-        
-        # Parse time, use 23:59 for empty time so tasks without time sort last within the day
-        if time_str and time_str.strip():
-            try:
-                hour, minute = map(int, time_str.split(':'))
-                time_val = (0, hour, minute)  # 0 prefix means has time, sorts first
-            except:
-                time_val = (1, 23, 59)  # No valid time, sort last
-        else:
-            time_val = (1, 23, 59)  # No time specified, sort last within the day
-        
-        return (date_val, time_val, -int(priority))
+    # Sort key for a task (date, time, inverse priority); a plain function, so self._task_sort_key
+    # is the memoized function itself
+    _task_sort_key = staticmethod(_sort_key)
 
     def add_multiple_tasks_dialog(self):
         """Show dialog to add multiple tasks at once"""
@@ -553,14 +869,19 @@ class ToDoListManager:
                 parsed_tasks = []
                 parse_errors = []
                 existing_tasks = self.load_tasks()
+                name_index = self._build_name_index(existing_tasks)
                 duplicates = []
+                duplicate_names = set()  # List each clashing name once, however often it is pasted
                 
                 for line in lines:
                     try:
                         task_info = self.parse_bulk_task_line(line)
-                        dup_index = self.find_duplicate_task(existing_tasks, task_info['task'])
+                        dup_index = self.find_duplicate_task(existing_tasks, task_info['task'], name_index)
                         if dup_index is not None:
-                            duplicates.append((task_info, existing_tasks[dup_index]))
+                            name_key = _name_key(task_info['task'])
+                            if name_key not in duplicate_names:
+                                duplicate_names.add(name_key)
+                                duplicates.append((task_info, existing_tasks[dup_index]))
                         parsed_tasks.append(task_info)
                     except Exception as e:
                         parse_errors.append(f"'{line}': {str(e)}")
@@ -572,15 +893,24 @@ class ToDoListManager:
                     if duplicate_action == "cancel":
                         return  # User cancelled the whole operation
                 
-                # Second pass: add tasks based on duplicate handling preference
+                # Second pass: add tasks based on duplicate handling preference.
+                # Tasks go into the in-memory list; it is saved and redrawn once at the end.
                 added_count = 0
                 skipped_count = 0
                 overwritten_count = 0
+                # Every name that may be in the list (existing plus added so far); a name
+                # not in here cannot be a duplicate, so most lines skip the list scan
+                known_names = set(name_index)
                 
                 for task_info in parsed_tasks:
                     try:
                         # Check for duplicate
-                        dup_index = self.find_duplicate_task(self.load_tasks(), task_info['task'])
+                        tasks = self._tasks
+                        name_key = _name_key(task_info['task'])
+                        dup_index = None
+                        if name_key in known_names:
+                            dup_index = self.find_duplicate_task(tasks, task_info['task'])
+                        known_names.add(name_key)
                         
                         if dup_index is not None:
                             if duplicate_action == "skip_all":
@@ -588,37 +918,39 @@ class ToDoListManager:
                                 continue
                             elif duplicate_action == "overwrite_all":
                                 # Remove old task first, then add new (skip duplicate check)
-                                tasks = self.load_tasks()
                                 tasks.pop(dup_index)
-                                self.save_tasks(tasks)
-                                self.add_task(task_info['task'], task_info['date'], 
-                                            task_info.get('due_time', ''), task_info['priority'], 
-                                            task_info['notes'], check_duplicate=False)
+                                self._insert_task(task_info['task'], task_info['date'], 
+                                                  task_info.get('due_time', ''), task_info['priority'], 
+                                                  task_info['notes'], check_duplicate=False)
                                 overwritten_count += 1
                                 added_count += 1
                             elif duplicate_action == "create_all":
                                 # Add without checking duplicates
-                                self.add_task(task_info['task'], task_info['date'], 
-                                            task_info.get('due_time', ''), task_info['priority'], 
-                                            task_info['notes'], check_duplicate=False)
+                                self._insert_task(task_info['task'], task_info['date'], 
+                                                  task_info.get('due_time', ''), task_info['priority'], 
+                                                  task_info['notes'], check_duplicate=False)
                                 added_count += 1
                             else:  # "ask" - ask for each individual duplicate
-                                result = self.add_task(task_info['task'], task_info['date'], 
-                                                      task_info.get('due_time', ''), task_info['priority'], 
-                                                      task_info['notes'], check_duplicate=True)
+                                result = self._insert_task(task_info['task'], task_info['date'], 
+                                                           task_info.get('due_time', ''), task_info['priority'], 
+                                                           task_info['notes'], check_duplicate=True)
                                 if result:
                                     added_count += 1
                                 else:
                                     skipped_count += 1
                         else:
                             # No duplicate, just add
-                            self.add_task(task_info['task'], task_info['date'], 
-                                        task_info.get('due_time', ''), task_info['priority'], 
-                                        task_info['notes'], check_duplicate=False)
+                            self._insert_task(task_info['task'], task_info['date'], 
+                                              task_info.get('due_time', ''), task_info['priority'], 
+                                              task_info['notes'], check_duplicate=False)
                             added_count += 1
                     except Exception as e:
                         parse_errors.append(f"'{task_info['task']}': {str(e)}")
                 
+                if parsed_tasks:
+                    self.save_tasks(self._tasks)
+                    self.schedule_refresh()
+                
                 # Show summary
                 summary_parts = []
                 if added_count > 0:
@@ -656,7 +988,7 @@ class ToDoListManager:
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Instructions
-        instructions = ttk.Label(main_frame, text="Enter multiple tasks (one per line). Use keywords for dates and priorities:", font=('Helvetica', 10, 'bold'))
+        instructions = ttk.Label(main_frame, text="Enter multiple tasks (one per line). Use keywords for dates and priorities:", font=self._label_font)
         instructions.pack(anchor='w', pady=(0, 5))
         
         # Format help
@@ -683,7 +1015,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         help_label.pack(anchor='w', pady=(0, 10))
         
         # Input area
-        ttk.Label(main_frame, text="Tasks:", font=('Helvetica', 10, 'bold')).pack(anchor='w')
+        ttk.Label(main_frame, text="Tasks:", font=self._label_font).pack(anchor='w')
         
         # Text input with scrollbar
         text_frame = ttk.Frame(main_frame)
@@ -697,7 +1029,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Preview area
-        ttk.Label(main_frame, text="Preview (parsed tasks):", font=('Helvetica', 10, 'bold')).pack(anchor='w', pady=(10, 5))
+        ttk.Label(main_frame, text="Preview (parsed tasks):", font=self._label_font).pack(anchor='w', pady=(10, 5))
         
         preview_frame = ttk.Frame(main_frame)
         preview_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -710,48 +1042,104 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         preview_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Function to update preview
+        last_content = None  # Text the preview currently shows
+        shown_rows = None  # Preview lines in the widget, or None while it shows a message
+        
+        def show_rows(rows):
+            """Rewrite only the preview lines that differ from the ones shown"""
+            if shown_rows is None:
+                preview_text.delete("1.0", tk.END)
+                preview_text.insert("1.0", '\n'.join(rows))
+                return
+            # Typing usually touches one line, so skip the unchanged lines at either end
+            limit = min(len(shown_rows), len(rows))
+            start = 0
+            while start < limit and shown_rows[start] == rows[start]:
+                start += 1
+            tail = 0
+            while tail < limit - start and shown_rows[-1 - tail] == rows[-1 - tail]:
+                tail += 1
+            old_stop = len(shown_rows) - tail
+            new_rows = rows[start:len(rows) - tail]
+            if tail:
+                # Whole lines start..old_stop, each with its newline, are replaced
+                preview_text.delete(f"{start + 1}.0", f"{old_stop + 1}.0")
+                preview_text.insert(f"{start + 1}.0", ''.join(row + '\n' for row in new_rows))
+            elif start:
+                # Changes run to the end: cut after the last unchanged line
+                preview_text.delete(f"{start}.end", tk.END)
+                preview_text.insert(tk.END, ''.join('\n' + row for row in new_rows))
+            else:
+                preview_text.delete("1.0", tk.END)
+                preview_text.insert("1.0", '\n'.join(rows))
+        
         def update_preview():
             """Update the preview with parsed tasks"""
+            nonlocal last_content, shown_rows
             try:
                 content = tasks_text.get("1.0", tk.END).strip()
+                if content == last_content:  # e.g. only the cursor moved
+                    return
+                last_content = content
                 if not content:
                     preview_text.config(state='normal')
                     preview_text.delete("1.0", tk.END)
                     preview_text.insert("1.0", "No tasks entered yet...")
                     preview_text.config(state='disabled')
+                    shown_rows = None
                     return
                 
                 lines = [line.strip() for line in content.split('\n') if line.strip()]
                 parsed_tasks = []
                 
+                append = parsed_tasks.append
                 for i, line in enumerate(lines, 1):
                     try:
                         task_info = self.parse_bulk_task_line(line)
-                        time_display = f" @ {task_info.get('due_time', '')}" if task_info.get('due_time') else ""
-                        parsed_tasks.append(f"{i}. {task_info['task']} | {task_info['date']}{time_display} | Priority {task_info['priority']}")
-                        if task_info['notes']:
-                            parsed_tasks.append(f"   Notes: {task_info['notes']}")
+                        due_time = task_info['due_time']
+                        notes = task_info['notes']
+                        time_display = f" @ {due_time}" if due_time else ""
+                        append(f"{i}. {task_info['task']} | {task_info['date']}{time_display} | Priority {task_info['priority']}")
+                        if notes:
+                            append(f"   Notes: {notes}")
                     except Exception as e:
-                        parsed_tasks.append(f"{i}. ERROR: {line} - {str(e)}")
+                        append(f"{i}. ERROR: {line} - {str(e)}")
                 
                 preview_text.config(state='normal')
-                preview_text.delete("1.0", tk.END)
-                preview_text.insert("1.0", '\n'.join(parsed_tasks))
+                show_rows(parsed_tasks)
                 preview_text.config(state='disabled')
+                shown_rows = parsed_tasks
                 
             except Exception as e:
                 preview_text.config(state='normal')
                 preview_text.delete("1.0", tk.END)
                 preview_text.insert("1.0", f"Preview error: {str(e)}")
                 preview_text.config(state='disabled')
+                shown_rows = None
+        
+        # Bind text change to update preview, once typing pauses rather than on every key
+        preview_job = None
+        
+        def run_preview():
+            nonlocal preview_job
+            preview_job = None
+            if dialog.winfo_exists():  # The dialog may have closed in the meantime
+                update_preview()
         
-        # Bind text change to update preview
         def on_text_change(event=None):
-            dialog.after_idle(update_preview)
+            nonlocal preview_job
+            if preview_job is not None:
+                dialog.after_cancel(preview_job)
+            preview_job = dialog.after(150, run_preview)
+        
+        def on_text_modified(event=None):
+            # <<Modified>> fires when Tk sets the text's modified flag (typing, pasting,
+            # deleting); clearing the flag re-arms it for the next change
+            if tasks_text.edit_modified():
+                tasks_text.edit_modified(False)
+                on_text_change()
         
-        tasks_text.bind('<KeyRelease>', on_text_change)
-        tasks_text.bind('<Button-1>', on_text_change)
-        tasks_text.bind('<FocusOut>', on_text_change)
+        tasks_text.bind('<<Modified>>', on_text_modified)
         
         # Initial preview
         update_preview()
@@ -760,9 +1148,13 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         """Parse a single line from bulk task input into task components"""
         if not line.strip():
             raise ValueError("Empty line")
-        
+        # Keyed on the day too, since relative dates ("tomorrow", "friday") depend on it.
+        # The cached dict is copied so callers can't modify it
+        return dict(self._parse_bulk_cached(line, date.today()))
+
+    def _parse_bulk_task_line(self, line, today):
+        """Uncached parse_bulk_task_line for a non-blank line, with today's date"""
         # Default values
-        today = datetime.now()
         task_info = {
             'task': line.strip(),
             'date': today.strftime("%m-%d-%Y"),
@@ -771,14 +1163,28 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
             'notes': ""
         }
         
-        # Split by common delimiters to extract components
-        delimiters = [' - ', ' | ', ' :: ', ' // ']
+        # Fast path: a plain task name (see _BULK_KEYWORDS) keeps every default above
+        lowered = line.lower()
+        has_delimiter = _BULK_DELIMITER_RE.search(line) is not None
+        if (not _DIGIT_RE.search(line)
+                and not has_delimiter
+                and not _PRIORITY_HINT_RE.search(lowered)
+                and _BULK_KEYWORDS.isdisjoint(_LETTERS_RE.findall(lowered))):
+            task_info['task'] = ' '.join(line.split())
+            return task_info
+        
+        # One clock reading for every date parsed from this line
+        now = datetime.now()
+        
+        # Split by common delimiters to extract components. Only the first delimiter
+        # of _BULK_DELIMITERS found in the line is split on, so "a - b | c" keeps "b | c"
         parts = [line]
         
-        for delimiter in delimiters:
-            if delimiter in line:
-                parts = [part.strip() for part in line.split(delimiter)]
-                break
+        if has_delimiter:
+            for delimiter in _BULK_DELIMITERS:
+                if delimiter in line:
+                    parts = [part.strip() for part in line.split(delimiter)]
+                    break
         
         # Extract task name (first part, will be refined)
         task_name = parts[0].strip()
@@ -796,7 +1202,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                 continue
                 
             # Try to extract date
-            date_result = self.extract_date_from_text(part)
+            date_result = self.extract_date_from_text(part, now)
             if date_result:
                 task_info['date'] = date_result
                 continue
@@ -820,28 +1226,35 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         task_words = task_name.split()
         clean_task_words = []
         
+        # Words without a digit only reach the date parser if they are date words
+        # (_DATE_WORDS, _DATE_PHRASE_STARTS) - nothing else could match - and never the
+        # time parser, whose patterns all need a digit
+        has_digit = [_DIGIT_RE.search(word) is not None for word in task_words]
         i = 0
         while i < len(task_words):
             word = task_words[i]
+            lowered_word = word.lower()
             
             # Check for multi-word date patterns first (like "next friday")
-            if i < len(task_words) - 1:
+            if i < len(task_words) - 1 and (has_digit[i] or has_digit[i + 1]
+                                            or lowered_word in _DATE_PHRASE_STARTS):
                 two_word = f"{word} {task_words[i + 1]}"
-                date_result = self.extract_date_from_text(two_word)
+                date_result = self.extract_date_from_text(two_word, now)
                 if date_result:
                     task_info['date'] = date_result
                     i += 2  # Skip both words
                     continue
             
             # Check for single word date
-            date_result = self.extract_date_from_text(word)
-            if date_result and len(word) > 2:  # Avoid single letters/numbers being treated as dates
-                task_info['date'] = date_result
-                i += 1
-                continue
+            if has_digit[i] or lowered_word in _DATE_WORDS:
+                date_result = self.extract_date_from_text(word, now)
+                if date_result and len(word) > 2:  # Avoid single letters/numbers being treated as dates
+                    task_info['date'] = date_result
+                    i += 1
+                    continue
             
             # Check for time patterns
-            time_result = self.extract_time_from_text(word)
+            time_result = self.extract_time_from_text(word) if has_digit[i] else None
             if time_result:
                 # Store as due_time
                 task_info['due_time'] = time_result
@@ -849,7 +1262,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                 continue
             
             # Check for priority keywords in task name, but only if it looks like priority
-            if any(priority_word in word.lower() for priority_word in ['priority', 'urgent', 'high', 'low', 'medium']):
+            if _PRIORITY_HINT_RE.search(lowered_word):
                 priority_result = self.extract_priority_from_text(word)
                 if priority_result:
                     task_info['priority'] = priority_result
@@ -860,8 +1273,12 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
             clean_task_words.append(word)
             i += 1
         
-        # Reconstruct clean task name and apply final cleaning
-        task_info['task'] = ' '.join(clean_task_words).strip()
+        # Reconstruct clean task name and apply final cleaning. When no word was taken
+        # out, the name is already in that form (clean_due_phrases normalized its spaces)
+        if len(clean_task_words) == len(task_words):
+            task_info['task'] = task_name.strip()
+        else:
+            task_info['task'] = ' '.join(clean_task_words).strip()
         task_info['task'] = self.clean_due_phrases(task_info['task'])
         
         # Join remaining parts as notes
@@ -878,24 +1295,12 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         
         return task_info
 
-    def extract_date_from_text(self, text):
-        """Extract date from text and return formatted date string"""
+    def extract_date_from_text(self, text, today=None):
+        """Extract date from text and return formatted date string (relative to today, a datetime)"""
         original_text = text
         text = text.lower().strip()
-        today = datetime.now()
-        
-        # Month name mappings
-        month_names = {
-            'january': 1, 'jan': 1, 'february': 2, 'feb': 2, 'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4, 'may': 5, 'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7, 'august': 8, 'aug': 8, 'september': 9, 'sep': 9, 'sept': 9,
-            'october': 10, 'oct': 10, 'november': 11, 'nov': 11, 'december': 12, 'dec': 12
-        }
-        
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        weekday_abbrevs = {'mon': 'monday', 'tue': 'tuesday', 'tues': 'tuesday', 'wed': 'wednesday', 
-                          'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday',
-                          'fri': 'friday', 'sat': 'saturday', 'sun': 'sunday'}
+        if today is None:
+            today = datetime.now()
         
         # Handle relative dates
         if text in ['today', 'now']:
@@ -929,7 +1334,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
             return datetime(today.year, 12, 31).strftime("%m-%d-%Y")
         
         # Handle "in X days/weeks/months"
-        in_pattern = re.match(r'in\s+(\d+)\s*(day|days|week|weeks|month|months)', text)
+        in_pattern = _IN_PERIOD_RE.match(text)
         if in_pattern:
             num = int(in_pattern.group(1))
             unit = in_pattern.group(2)
@@ -954,9 +1359,8 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         # Handle "next monday", "next friday", etc.
         if text.startswith('next '):
             day_name = text.replace('next ', '').strip()
-            day_name = weekday_abbrevs.get(day_name, day_name)
-            if day_name in weekdays:
-                target_weekday = weekdays.index(day_name)
+            target_weekday = _WEEKDAY_IDX.get(_WEEKDAY_ABBREVS.get(day_name, day_name))
+            if target_weekday is not None:
                 days_ahead = target_weekday - today.weekday()
                 if days_ahead <= 0:  # Target day already happened this week
                     days_ahead += 7
@@ -965,18 +1369,16 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         # Handle "this friday", etc.
         if text.startswith('this '):
             day_name = text.replace('this ', '').strip()
-            day_name = weekday_abbrevs.get(day_name, day_name)
-            if day_name in weekdays:
-                target_weekday = weekdays.index(day_name)
+            target_weekday = _WEEKDAY_IDX.get(_WEEKDAY_ABBREVS.get(day_name, day_name))
+            if target_weekday is not None:
                 days_ahead = target_weekday - today.weekday()
                 if days_ahead < 0:  # If the day has passed this week, get next week's
                     days_ahead += 7
                 return (today + timedelta(days=days_ahead)).strftime("%m-%d-%Y")
         
         # Handle standalone weekday names (e.g., "monday", "fri")
-        standalone_day = weekday_abbrevs.get(text, text)
-        if standalone_day in weekdays:
-            target_weekday = weekdays.index(standalone_day)
+        target_weekday = _WEEKDAY_IDX.get(_WEEKDAY_ABBREVS.get(text, text))
+        if target_weekday is not None:
             days_ahead = target_weekday - today.weekday()
             if days_ahead <= 0:  # Target day already happened this week, get next week
                 days_ahead += 7
@@ -984,11 +1386,11 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         
         # Handle month + day formats: "Feb 15", "February 15", "Feb 15th", "15 Feb", "15th February"
         # Pattern: Month Day (with optional ordinal)
-        month_day_pattern = re.match(r'([a-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s*,?\s*(\d{4}))?', text)
+        month_day_pattern = _MONTH_DAY_RE.match(text)
         if month_day_pattern:
             month_str, day, year = month_day_pattern.groups()
-            if month_str in month_names:
-                month = month_names[month_str]
+            month = _MONTH_NAMES.get(month_str)
+            if month is not None:
                 day = int(day)
                 year = int(year) if year else today.year
                 # If the date has passed this year, use next year
@@ -1005,11 +1407,11 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                     pass
         
         # Pattern: Day Month (with optional ordinal)
-        day_month_pattern = re.match(r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([a-z]+)(?:\s*,?\s*(\d{4}))?', text)
+        day_month_pattern = _DAY_MONTH_RE.match(text)
         if day_month_pattern:
             day, month_str, year = day_month_pattern.groups()
-            if month_str in month_names:
-                month = month_names[month_str]
+            month = _MONTH_NAMES.get(month_str)
+            if month is not None:
                 day = int(day)
                 year = int(year) if year else today.year
                 # If the date has passed this year, use next year
@@ -1026,7 +1428,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                     pass
         
         # Handle just ordinal day ("the 15th", "15th") - assumes current or next month
-        ordinal_pattern = re.match(r'(?:the\s+)?(\d{1,2})(?:st|nd|rd|th)', text)
+        ordinal_pattern = _ORDINAL_DAY_RE.match(text)
         if ordinal_pattern:
             day = int(ordinal_pattern.group(1))
             if 1 <= day <= 31:
@@ -1043,16 +1445,21 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                     pass
         
         # Handle absolute dates - improved patterns
-        date_patterns = [
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # MM/DD/YYYY or MM-DD-YYYY
-            r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',  # YYYY/MM/DD or YYYY-MM-DD
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{2})',  # MM/DD/YY or MM-DD-YY
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})',      # MM.DD.YYYY
-            r'(\d{1,2})\.(\d{1,2})\.(\d{2})',      # MM.DD.YY
-        ]
+        # A whole MM/DD/YYYY or MM-DD-YYYY word is read directly; the result is the one the
+        # first pattern below would give. Invalid dates still go through the patterns, which
+        # may find a shorter date inside the text
+        if len(text) == 10 and text[2] in "/-" and text[5] in "/-" and text.isascii():
+            month, day, year = text[:2], text[3:5], text[6:]
+            if month.isdigit() and day.isdigit() and year.isdigit():
+                month, day, year = int(month), int(day), int(year)
+                if 1 <= month <= 12 and 1 <= day <= 31:
+                    try:
+                        return datetime(year, month, day).strftime("%m-%d-%Y")
+                    except ValueError:
+                        pass
         
-        for i, pattern in enumerate(date_patterns):
-            match = re.search(pattern, text)
+        for i, pattern in enumerate(_DATE_PATTERNS):
+            match = pattern.search(text)
             if match:
                 try:
                     groups = match.groups()
@@ -1077,18 +1484,13 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         """Extract priority from text and return priority number"""
         text = text.lower().strip()
         
-        # Direct priority numbers (case insensitive)
-        priority_patterns = [
-            r'priority\s*(\d)',
-            r'pri\s*(\d)',
-            r'p\s*(\d)'
-        ]
-        
-        for pattern in priority_patterns:
-            priority_match = re.search(pattern, text)
-            if priority_match:
-                priority = int(priority_match.group(1))
-                return priority if 1 <= priority <= 5 else 1
+        # Direct priority numbers (case insensitive); every pattern starts with a "p"
+        if 'p' in text:
+            for pattern in _PRIORITY_PATTERNS:
+                priority_match = pattern.search(text)
+                if priority_match:
+                    priority = int(priority_match.group(1))
+                    return priority if 1 <= priority <= 5 else 1
         
         # Priority keywords - corrected mapping (1 = highest, 5 = lowest)
         if any(word in text for word in ['urgent', 'critical', 'asap']):
@@ -1111,17 +1513,18 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         """Extract time from text and return formatted time string"""
         text = text.strip()
         
-        # Time patterns to match
-        time_patterns = [
-            r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)',  # 12:30 PM, 2:15 am
-            r'(\d{1,2}):(\d{2})',                  # 14:30, 09:15 (24-hour)
-            r'(\d{1,2})\s*(am|pm|AM|PM)',          # 2 PM, 9 am
-            r'(\d{1,2})(\d{2})\s*(am|pm|AM|PM)',   # 230 PM, 915 am
-            r'(\d{1,2})(\d{2})',                   # 1430, 0915 (24-hour without colon)
-        ]
+        # Every time pattern needs a digit, the first two a colon and the 12-hour ones an
+        # am/pm; patterns that can't match are skipped, the rest are tried in order
+        if not _DIGIT_RE.search(text):
+            return None
+        has_colon = ':' in text
+        has_ampm = _AMPM_RE.search(text) is not None
         
-        for i, pattern in enumerate(time_patterns):
-            match = re.search(pattern, text)
+        # Time patterns to match
+        for i, pattern in enumerate(_TIME_PATTERNS):
+            if (i < 2 and not has_colon) or (i in (0, 2, 3) and not has_ampm):
+                continue
+            match = pattern.search(text)
             if match:
                 try:
                     groups = match.groups()
@@ -1177,34 +1580,14 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         if not text or not text.strip():
             return text
             
-        # Patterns to remove (case insensitive)
-        # These patterns match prepositions when followed by date/time indicators
-        due_patterns = [
-            r'\bdue\s+at\b',
-            r'\bdue\s+on\b',
-            r'\bdue\s+by\b',
-            r'\bdue\s+for\b',
-            r'\bdue\b(?=\s+\d)',  # "due" followed by date/time
-            r'\bdue\b(?=\s+(?:today|tomorrow|tmr|monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
-            r'\bdue\b(?=\s+(?:next|this|end\s+of))',
-            r'\bdue\b(?=\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))',
-            # Standalone prepositions before date/time (but keep them if part of task name)
-            r'\b(?:on|at|by|for)\b(?=\s+(?:today|tomorrow|tmr|tmrw))',
-            r'\b(?:on|at|by|for)\b(?=\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
-            r'\b(?:on|at|by|for)\b(?=\s+(?:mon|tue|wed|thu|fri|sat|sun)\b)',
-            r'\b(?:on|at|by|for)\b(?=\s+(?:next|this)\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday|week|month))',
-            r'\b(?:on|at|by|for)\b(?=\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))',
-            r'\b(?:on|at|by|for)\b(?=\s+\d{1,2}[/\-])',  # Before date patterns like 02/15
-            r'\b(?:on|at|by|for)\b(?=\s+the\s+\d{1,2}(?:st|nd|rd|th))',  # "on the 15th"
-            r'\b(?:on|at|by)\b(?=\s+\d{1,2}(?:st|nd|rd|th))',  # "on 15th"
-        ]
-        
+        # Remove the prepositions that introduce a date/time (case insensitive)
         cleaned_text = text
-        for pattern in due_patterns:
-            cleaned_text = re.sub(pattern, '', cleaned_text, flags=re.IGNORECASE)
+        if _DUE_WORD_RE.search(text):
+            for pattern in _DUE_PATTERNS:
+                cleaned_text = pattern.sub('', cleaned_text)
         
         # Clean up extra whitespace
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+        cleaned_text = _WS_RE.sub(' ', cleaned_text).strip()
         
         return cleaned_text
 
@@ -1223,18 +1606,10 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         
         task_to_remove = self.task_data[item_id]
         
-        tasks = self.load_tasks()
-        task_found = None
-        index = -1
-        
-        # Find the task by matching all fields
-        for i, task in enumerate(tasks):
-            if task[:4] == task_to_remove[:4]:  # Match task, date, time, priority
-                task_found = task
-                index = i
-                break
+        tasks = self._tasks
+        index = self._task_position(item_id, task_to_remove)
         
-        if task_found is None:
+        if index < 0:
             messagebox.showerror("Error", "Task not found in data file")
             return
         
@@ -1245,7 +1620,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         self.parent_app.save_character()
         self.parent_app.update_character_labels()
         self.save_tasks(tasks)
-        self.refresh_task_list()
+        self.schedule_refresh()
         
     def edit_task(self):
         """Edit selected task"""
@@ -1266,20 +1641,13 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         
         task_to_edit = self.task_data[item_id]
 
-        tasks = self.load_tasks()
-        task_found = None
-        index = -1
+        tasks = self._tasks
+        index = self._task_position(item_id, task_to_edit)
         
-        # Find the task by matching all fields
-        for i, task in enumerate(tasks):
-            if task[:4] == task_to_edit[:4]:  # Match task, date, time, priority
-                task_found = task
-                index = i
-                break
-        
-        if task_found is None:
+        if index < 0:
             messagebox.showerror("Error", "Task not found in data file")
             return
+        task_found = task_to_edit
         
         dialog = tk.Toplevel(self.parent_app.root)
         dialog.title("Edit Task")
@@ -1291,16 +1659,18 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         ttk.Label(dialog, text="Task:").grid(row=0, column=0, padx=5, pady=5, sticky="nw")
         task_entry = ttk.Entry(dialog, width=40)
         task_entry.grid(row=0, column=1, padx=5, pady=5)
-        task_entry.insert(0, task_found[0])
+        task_entry.insert(0, task_found.name)
         
         ttk.Label(dialog, text="Due Date:").grid(row=1, column=0, padx=5, pady=5, sticky="nw")
+        # Imported lazily - tkcalendar pulls in babel, which is slow to load at startup
+        from tkcalendar import DateEntry
         date_entry = DateEntry(dialog,
                              date_pattern="mm-dd-yyyy",
                              background="darkblue", 
                              foreground="white",
                              borderwidth=2)
         date_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        date_entry.set_date(datetime.strptime(task_found[1], "%m-%d-%Y"))
+        date_entry.set_date(task_found.due_date)
         
         ttk.Label(dialog, text="Due Time:").grid(row=2, column=0, padx=5, pady=5, sticky="nw")
         time_frame = ttk.Frame(dialog)
@@ -1312,7 +1682,7 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
             use_24_hour = self.parent_app.use_24_hour.get()
         
         # Parse existing time (stored in 24-hour format)
-        existing_time = task_found[2] if len(task_found) > 2 else ""
+        existing_time = task_found.time
         existing_hour = ""
         existing_minute = ""
         existing_ampm = "AM"
@@ -1372,14 +1742,12 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         priority_entry = ttk.Spinbox(dialog, from_=1, to=5)
         priority_entry.grid(row=3, column=1, padx=5, pady=5, sticky="w")
         priority_entry.delete(0, tk.END)
-        priority_entry.insert(0, task_found[3])
+        priority_entry.insert(0, task_found.priority)
         
         ttk.Label(dialog, text="Notes/Details:").grid(row=4, column=0, padx=5, pady=5, sticky="nw")
         notes_text = tk.Text(dialog, width=40, height=6, wrap=tk.WORD)
         notes_text.grid(row=4, column=1, padx=5, pady=5)
-        # Insert existing notes if available
-        if len(task_found) > 4:
-            notes_text.insert("1.0", task_found[4])
+        notes_text.insert("1.0", task_found.notes)
         
         def validate_and_edit():
             date = self.parse_date(date_entry.get())
@@ -1425,10 +1793,29 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
                 messagebox.showerror("Error", "Priority must be 1-5")
                 return
             
-            notes = notes_text.get("1.0", tk.END).strip()
-            tasks[index] = (task_entry.get(), date, due_time, priority, notes)
-            self.save_tasks(tasks)
-            self.refresh_task_list()
+            notes = notes_text.get("1.0", tk.END).strip() or NO_NOTES
+            edited = Task(task_entry.get(), date, due_time, priority, notes)
+            if (edited[1:4] == task_found[1:4]
+                    and self.task_data.get(item_id) is task_found and tasks is self._tasks):
+                # Same date, time and priority text - the row keeps its place, colour and
+                # cells apart from the name, so update it in place instead of rebuilding
+                # the whole list. (Comparing sort keys is not enough: a legacy "1-5-2026"
+                # re-saved as "01-05-2026" sorts the same but must be redrawn.)
+                tasks[index] = edited
+                self.task_data[item_id] = edited
+                self.tree.set(item_id, "Task", edited.name)
+                self.save_tasks(tasks)
+                if hasattr(self.parent_app, 'calendar_view') and self.parent_app.calendar_view:
+                    self.parent_app.calendar_view.refresh()
+                    # Up to date now - the next list refresh need not redraw it again
+                    self._calendar_dirty = False
+                    self._calendar_day = datetime.now().date()
+            else:
+                # The edit may change the sort key, so move the task to its new slot
+                del tasks[index]
+                bisect.insort(tasks, edited, key=self._task_sort_key)
+                self.save_tasks(tasks)
+                self.schedule_refresh()
             dialog.destroy()
             
         ttk.Button(dialog, text="Save", command=validate_and_edit).grid(row=5, columnspan=2, pady=10)
@@ -1448,223 +1835,237 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
         
         task_to_remove = self.task_data[item_id]
         
-        tasks = self.load_tasks()
-        task_found = None
-        index = -1
+        tasks = self._tasks
+        index = self._task_position(item_id, task_to_remove)
         
-        # Find the task by matching all fields
-        for i, task in enumerate(tasks):
-            if task[:4] == task_to_remove[:4]:  # Match task, date, time, priority
-                task_found = task
-                index = i
-                break
-        
-        if task_found is None:
+        if index < 0:
             messagebox.showerror("Error", "Task not found in data file")
             return
         
         del tasks[index]
         self.save_tasks(tasks)
-        self.refresh_task_list()
+        self.schedule_refresh()
+
+    def _task_position(self, item_id, task):
+        """Index of a row's task in the task list, or -1 if it is no longer there"""
+        tasks = self._tasks
+        # Position recorded by refresh_task_list; it only holds while the row is current
+        index = self._task_index.get(item_id, -1)
+        if 0 <= index < len(tasks) and tasks[index] is task:
+            return index
+        # The list changed since the row was drawn (e.g. a scheduled refresh hasn't run yet)
+        for index, candidate in enumerate(tasks):
+            if candidate is task:
+                return index
+        return -1
+
+    def schedule_refresh(self):
+        """Refresh the task list once Tk is idle, so several changes in a row redraw it only once"""
+        if self._refresh_job is None:
+            self._refresh_job = self.parent_app.root.after_idle(self.refresh_task_list)
 
     def refresh_task_list(self):
-        """Refresh the task list display"""
-        self.tree.delete(*self.tree.get_children())  # Clear existing tasks
-        tasks = self.load_tasks()  # Load tasks from file
+        """Refresh the task list display from the in-memory task list"""
+        if self._refresh_job is not None:  # This refresh covers the scheduled one
+            self.parent_app.root.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        if self._insert_job is not None:  # Drop rows still queued from the last refresh
+            self.parent_app.root.after_cancel(self._insert_job)
+            self._insert_job = None
+        children = self.tree.get_children()
+        if children:  # Clear existing tasks (no Tk call when the list is already empty)
+            self.tree.delete(*children)
+        tasks = self._tasks
         current_datetime = datetime.now()
         today = current_datetime.date()
+        # Current time of day, for comparing with today's due times without building datetimes
+        now_time = (current_datetime.hour, current_datetime.minute,
+                    current_datetime.second, current_datetime.microsecond)
         
         # Store task data for reference
         self.task_data = {}
+        self._task_index = {}
         
         # Categorize tasks
         overdue_tasks = []
         today_tasks = []
         upcoming_tasks = []
 
-        for task in tasks:
-            task_name = task[0]
-            due_date_str = task[1]
-            due_time_str = task[2] if len(task) > 2 else ""
-            priority = task[3] if len(task) > 3 else task[2]  # Handle old format
-            due_date = datetime.strptime(due_date_str, "%m-%d-%Y").date()
+        # The task list is already in sort order and splitting it into buckets keeps
+        # that order, so the buckets need no sorting of their own
+        next_overdue = None
+        for index, task in enumerate(tasks):
+            due_date = task.due_date
+            entry = (index, task)
             
             # Check if task is overdue considering time
             if due_date < today:
-                overdue_tasks.append(task)  # Overdue tasks
+                overdue_tasks.append(entry)  # Overdue tasks
             elif due_date == today:
-                # For today's tasks, check if time has passed
-                if due_time_str and ':' in due_time_str:
-                    try:
-                        hour, minute = map(int, due_time_str.split(':'))
-                        task_datetime = datetime.combine(due_date, datetime.min.time().replace(hour=hour, minute=minute))
-                        if task_datetime < current_datetime:
-                            overdue_tasks.append(task)  # Time has passed
-                        else:
-                            today_tasks.append(task)
-                    except:
-                        today_tasks.append(task)  # Due today
+                # For today's tasks, check if time has passed (the cached sort key
+                # already holds the parsed time)
+                no_time, hour, minute = task.time_key
+                if no_time or not (0 <= hour <= 23 and 0 <= minute <= 59):
+                    today_tasks.append(entry)  # Due today
+                elif (hour, minute, 0, 0) < now_time:
+                    overdue_tasks.append(entry)  # Time has passed
                 else:
-                    today_tasks.append(task)  # Due today
+                    today_tasks.append(entry)
+                    if next_overdue is None:  # Tasks are in time order, so this is the earliest
+                        next_overdue = current_datetime.replace(hour=hour, minute=minute, second=0, microsecond=0)
             else:
-                upcoming_tasks.append(task)  # Future tasks
+                upcoming_tasks.append(entry)  # Future tasks
+        self._next_overdue = next_overdue
 
-        # Sort each category using the sort key helper
-        overdue_tasks.sort(key=lambda x: self._task_sort_key(x))
-        today_tasks.sort(key=lambda x: self._task_sort_key(x))
-        upcoming_tasks.sort(key=lambda x: self._task_sort_key(x))
-        
-        # Helper function to format time for display
-        def format_display_time(time_str):
-            if not time_str or not time_str.strip():
-                return "--:--"
-            try:
-                hour, minute = map(int, time_str.split(':'))
-                # Check user's time format preference
-                if hasattr(self.parent_app, 'use_24_hour') and not self.parent_app.use_24_hour.get():
-                    # 12-hour format
-                    if hour == 0:
-                        return f"12:{minute:02d} AM"
-                    elif hour < 12:
-                        return f"{hour}:{minute:02d} AM"
-                    elif hour == 12:
-                        return f"12:{minute:02d} PM"
-                    else:
-                        return f"{hour-12}:{minute:02d} PM"
-                else:
-                    # 24-hour format
-                    return f"{hour:02d}:{minute:02d}"
-            except:
-                return "--:--"
-
-        # Insert into Treeview with colors and action buttons
-        for task in overdue_tasks:
-            time_display = format_display_time(task[2] if len(task) > 2 else "")
-            priority_val = task[3] if len(task) > 3 else task[2]
-            display_values = (task[0], task[1], time_display, priority_val, "✓", "✎", "✗")
-            item = self.tree.insert("", tk.END, values=display_values, tags=("overdue",), text=task[0])
+        # Formatter for the user's time format preference, chosen once for all rows
+        if hasattr(self.parent_app, 'use_24_hour') and not self.parent_app.use_24_hour.get():
+            format_display_time = _format_time_12
+        else:
+            format_display_time = _format_time_24
+
+        # Build the rows with colors and action buttons
+        rows = []
+        append = rows.append
+        for bucket, tags in ((overdue_tasks, ("overdue",)), (today_tasks, ("today",)), (upcoming_tasks, ())):
+            for index, task in bucket:
+                display_values = (task.name, task.date, format_display_time(task.time), task.priority, "✓", "✎", "✗")
+                append((display_values, tags, index, task))
+        self._insert_rows(rows, 0)
+
+        self._update_remaining_count(len(tasks))
+        
+        # Refresh calendar view if it exists and could have changed
+        if (hasattr(self.parent_app, 'calendar_view') and self.parent_app.calendar_view
+                and (self._calendar_dirty or today != self._calendar_day)):
+            self.parent_app.calendar_view.refresh()  # It reads the list through load_tasks()
+            self._calendar_dirty = False
+            self._calendar_day = today
+
+    def _insert_rows(self, rows, start, chunk=_ROW_CHUNK):
+        """Insert task rows into the Treeview, a chunk at a time for long lists"""
+        end = start + chunk
+        serial = self._row_serial
+        batch = []
+        for display_values, tags, index, task in rows[start:end]:
+            serial += 1
+            item = f"T{serial}"
+            batch.extend((item, display_values, tags))
             # Store the full task data (including notes) in our dictionary
             self.task_data[item] = task
-        for task in today_tasks:
-            time_display = format_display_time(task[2] if len(task) > 2 else "")
-            priority_val = task[3] if len(task) > 3 else task[2]
-            display_values = (task[0], task[1], time_display, priority_val, "✓", "✎", "✗")
-            item = self.tree.insert("", tk.END, values=display_values, tags=("today",), text=task[0])
-            self.task_data[item] = task
-        for task in upcoming_tasks:
-            time_display = format_display_time(task[2] if len(task) > 2 else "")
-            priority_val = task[3] if len(task) > 3 else task[2]
-            display_values = (task[0], task[1], time_display, priority_val, "✓", "✎", "✗")
-            item = self.tree.insert("", tk.END, values=display_values, text=task[0])
-            self.task_data[item] = task
+            self._task_index[item] = index
+        self._row_serial = serial
+        
+        # Insert the whole chunk with one Tcl call rather than one tree.insert per row.
+        # The item ids are chosen here, so nothing has to come back from Tk. The tree is
+        # headings-only, so the #0 "text" column is never shown and is not filled in.
+        # The loop runs inside an apply lambda so its variables stay local to it
+        if batch:
+            self.tree.tk.call(
+                "apply",
+                ("rows", f"foreach {{item values tags}} $rows "
+                         f"{{{self.tree} insert {{}} end -id $item -values $values -tags $tags}}"),
+                tuple(batch))
+        
+        # Hand the rest to the event loop so a very long list doesn't freeze the window
+        if end < len(rows):
+            self._insert_job = self.parent_app.root.after(1, self._insert_rows, rows, end)
+            self._insert_rest = (rows, end)
+        else:
+            self._insert_job = None
+            self._insert_rest = None
+
+    def has_overdue_change(self, now):
+        """True if a task shown as due today has become overdue since the last refresh"""
+        return self._next_overdue is not None and now > self._next_overdue
 
-        # Update the remaining tasks count in parent app
+    def _update_remaining_count(self, count):
+        """Update the remaining tasks label in parent app"""
         if hasattr(self.parent_app, 'remaining_label'):
-            self.parent_app.remaining_label.config(text=str(len(self.tree.get_children())))
-        
-        # Refresh calendar view if it exists
-        if hasattr(self.parent_app, 'calendar_view') and self.parent_app.calendar_view:
-            self.parent_app.calendar_view.refresh()
+            self.parent_app.remaining_label.config(text=str(count))
 
     def load_tasks(self):
+        """Return a copy of the current task list"""
+        return list(self._tasks)
+
+    def _read_tasks_file(self):
         """Load tasks from file"""
-        if not os.path.exists(self.TODO_FILE):
+        # Read directly instead of checking existence first (one syscall, not two)
+        try:
+            content = self.TODO_FILE.read_text()
+        except FileNotFoundError:
             return []
-        with open(self.TODO_FILE, "r") as f:
-            tasks = []
-            for line in f.readlines():
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
+        tasks = []
+        # Text mode already folds \r\n into \n; str.splitlines would also break on
+        # characters such as \x0c or \u2028 that may legitimately appear in notes
+        for line in content.split("\n"):
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+            
+            # At most 4 fields: whatever follows the third separator is handed back
+            # whole, so notes containing " | " never need to be re-joined
+            parts = line.split(" | ", 3)
+            if len(parts) >= 3:
+                try:
+                    task_name, due_date = parts[0], parts[1]
+                    rest = parts[3] if len(parts) > 3 else ""
                     
-                parts = line.split(" | ")
-                if len(parts) >= 3:
-                    try:
-                        task_name = parts[0]
-                        due_date = parts[1]
-                        
-                        # Check if this is old format (no time) or new format (with time)
-                        # Old format: task | date | priority | notes
-                        # New format: task | date | time | priority | notes
-                        
-                        # Try to detect format by checking if parts[2] looks like a time or priority
-                        potential_time = parts[2].strip()
-                        
-                        if ':' in potential_time or potential_time == "":
-                            # New format with time
-                            due_time = potential_time
-                            priority = parts[3].strip() if len(parts) > 3 else "5"
-                            
-                            # Validate priority is a number
-                            int(priority)
-                            
-                            # Handle notes
-                            if len(parts) > 4:
-                                notes = " | ".join(parts[4:]).strip()
-                                if not notes:
-                                    notes = "No notes"
-                            else:
-                                notes = "No notes"
-                        else:
-                            # Old format without time - parts[2] is priority
-                            due_time = ""
-                            priority = potential_time
-                            
-                            # Validate priority is a number
-                            int(priority)
-                            
-                            # Handle notes
-                            if len(parts) > 3:
-                                notes = " | ".join(parts[3:]).strip()
-                                if not notes:
-                                    notes = "No notes"
-                            else:
-                                notes = "No notes"
-                        
-                        tasks.append((task_name, due_date, due_time, priority, notes))
-                    except ValueError as e:
-                        # Skip malformed lines and show more detailed error info
-                        print(f"Warning: Skipping malformed line: {line}")
-                        print(f"Error details: {e}")
-                        print(f"Parts found: {parts}")
-                        continue
-            return sorted(tasks, key=lambda x: self._task_sort_key(x))
+                    # Check if this is old format (no time) or new format (with time)
+                    # Old format: task | date | priority | notes
+                    # New format: task | date | time | priority | notes
+                    
+                    # Try to detect format by checking if parts[2] looks like a time or priority
+                    potential_time = parts[2].strip()
+                    
+                    if ':' in potential_time or potential_time == "":
+                        # New format with time - rest is "priority | notes"
+                        due_time = potential_time
+                        priority, _, notes = rest.partition(" | ")
+                        # Priority must be a number
+                        priority = int(priority.strip()) if len(parts) > 3 else 5
+                    else:
+                        # Old format without time - parts[2] is priority, rest is notes
+                        due_time = ""
+                        priority = int(potential_time)  # Priority must be a number
+                        notes = rest
+                    
+                    notes = notes.strip() or NO_NOTES
+                    tasks.append(Task(task_name, due_date, due_time, priority, notes))
+                except ValueError as e:
+                    # Skip malformed lines and show more detailed error info
+                    print(f"Warning: Skipping malformed line: {line}")
+                    print(f"Error details: {e}")
+                    print(f"Parts found: {parts}")
+                    continue
+        return sorted(tasks, key=self._task_sort_key)
 
     def save_tasks(self, tasks, skip_mysql=False):
         """Save tasks to file and sync with MySQL if enabled"""
-        with open(self.TODO_FILE, "w") as f:
-            for task in tasks:
-                # Ensure we have exactly 5 elements (task, date, time, priority, notes)
-                if len(task) == 3:
-                    # Old format: (task, date, priority) -> add empty time and "No notes"
-                    task = (task[0], task[1], "", task[2], "No notes")
-                elif len(task) == 4:
-                    # Could be old format (task, date, priority, notes) or partial new format
-                    # Check if third element looks like a time
-                    if ':' in str(task[2]) or task[2] == "":
-                        # New format missing notes
-                        task = task + ("No notes",)
-                    else:
-                        # Old format (task, date, priority, notes) -> insert empty time
-                        task = (task[0], task[1], "", task[2], task[3])
-                elif len(task) > 5:
-                    # If somehow we have more than 5 elements, keep only first 5
-                    task = task[:5]
-                
-                # Convert all elements to strings
-                task_name, date, due_time, priority, notes = task
-                
-                # Handle empty notes - always ensure we have "No notes" if empty
-                if not notes or notes.strip() == "":
-                    notes = "No notes"
-                
-                # Handle empty time
-                if not due_time:
-                    due_time = ""
-                
-                # Create the line with proper formatting (including time)
-                task_line = f"{task_name} | {date} | {due_time} | {priority} | {notes}"
-                f.write(task_line + "\n")
+        self._calendar_dirty = True
+        # Normalize old/partial rows to (task, date, time, priority, notes) and keep the
+        # in-memory list in display order. The in-memory list itself is kept sorted by
+        # its in-place edits (bisect on insert), so only outside lists need sorting.
+        if tasks is not self._tasks:
+            normalized = []
+            for row in tasks:
+                try:
+                    task = Task.from_row(row)
+                    task.due_date  # Sorting needs a readable date as well as a numeric priority
+                except (ValueError, TypeError) as e:
+                    # Skip a malformed row (e.g. from a LAN or MySQL import) rather than
+                    # losing the whole save, as _read_tasks_file does for bad lines
+                    print(f"Warning: Skipping malformed task: {row}")
+                    print(f"Error details: {e}")
+                    continue
+                normalized.append(task)
+            self._tasks = sorted(normalized, key=self._task_sort_key)
+        
+        # Build the whole file here and let the writer thread put it on disk
+        lines = [
+            f"{task_name} | {date} | {due_time} | {priority} | {notes}\n"
+            for task_name, date, due_time, priority, notes in self._tasks
+        ]
+        self._queue_write("".join(lines))
     
         # Sync to MySQL if enabled and not skipping
         if (hasattr(self.parent_app, 'mysql_lan_manager') and 
@@ -1672,7 +2073,84 @@ Keywords: urgent/critical (=1), high/important (=2), medium/normal (=3), low/min
             hasattr(self.parent_app.mysql_lan_manager, 'mysql_enabled') and
             self.parent_app.mysql_lan_manager.mysql_enabled.get() and 
             not skip_mysql):
+            self._schedule_mysql_sync()
+
+    def _queue_write(self, content):
+        """Hand the new file contents to the writer thread (started on first use)"""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_worker, daemon=True)
+            self._writer_thread.start()
+        self._write_queue.put(content)
+
+    def _write_worker(self):
+        """Write queued file contents to disk, keeping the UI thread off the filesystem"""
+        while True:
+            content = self._write_queue.get()
+            # A later save supersedes anything still waiting - only the newest is written
+            while True:
+                try:
+                    newer = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._write_queue.task_done()
+                content = newer
             try:
-                self.parent_app.mysql_lan_manager.sync_tasks_to_mysql()
-            except Exception as e:
-                print(f"Failed to sync to MySQL: {e}")
\ No newline at end of file
+                # Write a temporary file and rename it over todo.txt so a crash mid-write
+                # never leaves a truncated task list behind. Rename over the real file, so
+                # a symlinked todo.txt stays a symlink
+                target = self.TODO_FILE.resolve()
+                tmp_file = target.with_name(target.name + ".tmp")
+                tmp_file.write_text(content)
+                tmp_file.replace(target)
+            except OSError as e:
+                print(f"Failed to save tasks: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def flush_pending_writes(self):
+        """Block until every queued save has been written to disk"""
+        self._write_queue.join()
+
+    def _schedule_mysql_sync(self):
+        """Queue a MySQL sync so that a burst of saves results in a single upload"""
+        # Snapshot now, on the UI thread: the upload runs on a worker thread that must not
+        # touch Tk, and at shutdown it may run after the window is gone. A later save in
+        # the same burst just replaces the snapshot
+        data = self.parent_app.mysql_lan_manager.collect_sync_data()
+        with self._sync_lock:
+            self._sync_data = data
+        if data is not None and self._sync_job is None:
+            self._sync_job = self.parent_app.root.after(500, self._flush_mysql_sync)
+
+    def _flush_mysql_sync(self):
+        """Run the queued MySQL sync off the UI thread"""
+        self._sync_job = None
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            # Previous upload still running - try again shortly rather than overlap it
+            self._sync_job = self.parent_app.root.after(500, self._flush_mysql_sync)
+            return
+        data = self._take_sync_data()
+        if data is not None:
+            self._sync_thread = threading.Thread(target=self._upload_sync_data, args=(data,), daemon=True)
+            self._sync_thread.start()
+
+    def _take_sync_data(self):
+        """Claim the queued sync snapshot, if any, so it is uploaded exactly once"""
+        with self._sync_lock:
+            data, self._sync_data = self._sync_data, None
+        return data
+
+    def _upload_sync_data(self, data):
+        """Send a collect_sync_data snapshot to MySQL (no Tk access)"""
+        try:
+            self.parent_app.mysql_lan_manager.upload_tasks(*data)
+        except Exception as e:
+            print(f"Failed to sync to MySQL: {e}")
+
+    def flush_pending_sync(self):
+        """Block until the running and any queued MySQL upload have finished (does not use Tk)"""
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+        data = self._take_sync_data()
+        if data is not None:
+            self._upload_sync_data(data)
\ No newline at end of file